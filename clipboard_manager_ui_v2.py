@@ -1,20 +1,25 @@
 import sys
 import hashlib
+from hashlib import sha256 as _sha256
 import getpass
+import hmac
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QListWidget, QListWidgetItem, QPushButton, QInputDialog, QMessageBox, QMenu, 
+    QListWidget, QListWidgetItem, QListView, QPushButton, QInputDialog, QMessageBox, QMenu, 
     QDialog, QScrollArea, QShortcut, QApplication, QLineEdit, QCheckBox, QTextEdit, 
-    QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QByteArray, QTimer, QEvent, QBuffer, QSettings
-from PyQt5.QtGui import QKeySequence, QImage, QPixmap, QIcon, QFontMetrics
+    QPlainTextEdit, QDialogButtonBox)
+from PyQt5.QtCore import (Qt, QAbstractListModel, QModelIndex, QPoint, pyqtSignal, QByteArray, QTimer, QBuffer,
+    QSettings, QThread, QObject, QRunnable, QThreadPool)
+from PyQt5.QtGui import (QKeySequence, QImage, QImageReader, QPixmap, QIcon, QFontMetrics,
+    QPixmapCache)
 import sqlite3
 import pyperclip
 from datetime import datetime, timezone
 import base64
-from PIL import Image
-import io
 import logging
-import threading
+import functools
+import contextlib
+from collections import OrderedDict
+import queue
 import time
 import os
 
@@ -36,13 +41,126 @@ if __name__ == '__main__':
     # Suppress IMKClient messages
     os.environ['PYQT_MAC_NO_NATIVE_MENUBAR'] = '1'
 
+# Colour states of a main window button. Destructive and secondary buttons are
+# picked out with the "danger" and "secondary" dynamic properties.
+BUTTON_STYLE_TEMPLATE = """
+    QWidget#MainPanel QPushButton{selector} {{
+        background-color: {base};
+    }}
+    QWidget#MainPanel QPushButton{selector}:hover {{
+        background-color: {hover};
+    }}
+    QWidget#MainPanel QPushButton{selector}:pressed {{
+        background-color: {pressed};
+    }}
+"""
+BLUE = {'selector': '', 'base': '#3498db', 'hover': '#2980b9', 'pressed': '#2473a6'}
+RED = {'selector': '[danger="true"]', 'base': '#e74c3c', 'hover': '#c0392b', 'pressed': '#a93226'}
+GREY = {'selector': '[secondary="true"]', 'base': '#95a5a6', 'hover': '#7f8c8d', 'pressed': '#6c7a7d'}
+
+# Main window styles; widgets other than buttons are picked out by objectName
+GLOBAL_QSS = """
+    QWidget#MainPanel QLabel#session_header {
+        color: #2c3e50;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 5px 0;
+    }
+    QWidget#MainPanel QLabel#history_header {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 5px;
+    }
+    QWidget#MainPanel QListWidget#session_list,
+    QWidget#MainPanel QListView#history_list {
+        border: 1px solid #bdc3c7;
+        border-radius: 5px;
+        background-color: white;
+        padding: 5px;
+    }
+    QWidget#MainPanel QListWidget#session_list::item {
+        padding: 5px;
+        border-bottom: 1px solid #ecf0f1;
+    }
+    QWidget#MainPanel QListView#history_list::item {
+        padding: 8px;
+        border-bottom: 1px solid #ecf0f1;
+    }
+    QWidget#MainPanel QListWidget#session_list::item:hover,
+    QWidget#MainPanel QListView#history_list::item:hover {
+        background-color: #ecf0f1;
+    }
+    QWidget#MainPanel QListWidget#session_list::item:selected,
+    QWidget#MainPanel QListView#history_list::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QWidget#MainPanel QPushButton {
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+        font-weight: 500;
+        font-size: 12px;
+        min-width: 120px;
+    }
+""" + "".join(BUTTON_STYLE_TEMPLATE.format_map(colors) for colors in (BLUE, RED, GREY))
+
+DB_PATH = 'clipboard_manager_v2.db'
+# Read-only connections kept open for history queries
+READ_POOL_SIZE = 3
+
+# Bump when initDatabase gains a new upgrade step
+SCHEMA_VERSION = 6
+
+# Number of characters of a text entry shown in the history list and hover preview
+TEXT_PREVIEW_LENGTH = 100
+THUMBNAIL_SIZE = 50
+# Encoding of stored images and thumbnails; passed to decoders to skip format sniffing
+IMAGE_FORMAT = 'PNG'
+# PNG writer quality for captured images; 80 selects zlib level 1, which
+# encodes several times faster than the default for a few percent more bytes
+IMAGE_ENCODE_QUALITY = 80
+
+# How often (ms) to check the clipboard on platforms without change notifications
+CLIPBOARD_POLL_INTERVAL = 500
+# Quiet period (ms) after a clipboard change before it is captured
+CLIPBOARD_DEBOUNCE_INTERVAL = 50
+
+# Number of recent captures remembered so copying them again only bumps the entry
+RECENT_ENTRIES_LIMIT = 256
+
+# Session list items keep the session id in Qt.UserRole and its bare name here
+SESSION_NAME_ROLE = Qt.UserRole + 1
+
+PASSWORD_SALT_BYTES = 16
+# Longer passwords are hashed without being kept in the retry cache
+PASSWORD_CACHE_MAX_LENGTH = 256
+
 class HoverPreviewWindow(QDialog):
+    _QSS = """
+        QDialog#HoverPreviewWindow {
+            background-color: rgba(255, 255, 255, 0.95);
+            border: 1px solid #ccc;
+            border-radius: 5px;
+        }
+        QDialog#HoverPreviewWindow QLabel {
+            background-color: white;
+            padding: 5px;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setObjectName('HoverPreviewWindow')
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         
+        # Keep decoded previews around so repeat hovers skip decode + scale (limit in KB)
+        QPixmapCache.setCacheLimit(10240)
+        
         # Create layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -52,45 +170,38 @@ class HoverPreviewWindow(QDialog):
         self.preview_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.preview_label)
         
-        # Style the window
-        self.setStyleSheet("""
-            QDialog {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: 1px solid #ccc;
-                border-radius: 5px;
-            }
-        """)
-        
-    def showPreview(self, content, content_type, pos):
+    def showPreview(self, content, content_type, pos, cache_key=None):
+        """Show an entry's preview; images are cached as pixmaps under cache_key."""
         if content_type == 'image':
             try:
-                # Convert base64 to image
-                image_data = QByteArray.fromBase64(content.encode())
-                image = QImage.fromData(image_data)
+                scaled_pixmap = QPixmapCache.find(cache_key)
                 
-                if not image.isNull():
-                    # Calculate preview size (max 300x300)
+                if scaled_pixmap is None:
+                    # Calculate preview size (max 300x300) and let the reader
+                    # downscale large images while decoding
                     preview_size = 300
-                    scaled_pixmap = QPixmap.fromImage(image).scaled(
-                        preview_size, preview_size,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.preview_label.setPixmap(scaled_pixmap)
+                    image = load_image(content, preview_size)
                     
-                    # Adjust window size to content
-                    self.adjustSize()
-                    
-                    # Position window near cursor but not under it
-                    self.move(pos.x() + 20, pos.y() - self.height() // 2)
-                    self.show()
+                    if not image.isNull():
+                        # Large images already arrive at preview size; only small
+                        # ones are enlarged, and fast scaling is good enough for that
+                        if image.width() < preview_size and image.height() < preview_size:
+                            image = image.scaled(
+                                preview_size, preview_size,
+                                Qt.KeepAspectRatio,
+                                Qt.FastTransformation
+                            )
+                        scaled_pixmap = QPixmap.fromImage(image)
+                        QPixmapCache.insert(cache_key, scaled_pixmap)
+                
+                if scaled_pixmap is not None:
+                    self.showPixmap(scaled_pixmap, pos)
             except Exception as e:
                 logging.error(f"Error showing preview: {e}")
         elif content_type == 'text':
-            # For text, show first 100 characters
-            preview_text = content[:100] + ('...' if len(content) > 100 else '')
+            # For text, show first TEXT_PREVIEW_LENGTH characters
+            preview_text = content[:TEXT_PREVIEW_LENGTH] + ('...' if len(content) > TEXT_PREVIEW_LENGTH else '')
             self.preview_label.setText(preview_text)
-            self.preview_label.setStyleSheet("QLabel { background-color: white; padding: 5px; }")
             
             # Adjust window size to content
             self.adjustSize()
@@ -98,10 +209,62 @@ class HoverPreviewWindow(QDialog):
             # Position window near cursor
             self.move(pos.x() + 20, pos.y() - self.height() // 2)
             self.show()
+    
+    def showPixmap(self, pixmap, pos):
+        """Show an already scaled image preview."""
+        self.preview_label.setPixmap(pixmap)
+        
+        # Adjust window size to content
+        self.adjustSize()
+        
+        # Position window near cursor but not under it
+        self.move(pos.x() + 20, pos.y() - self.height() // 2)
+        self.show()
 
 class PreviewDialog(QDialog):
-    def __init__(self, content, content_type, timestamp=None, parent=None):
+    # Quiet period (ms) after a resize before the image is rescaled
+    RESIZE_DEBOUNCE_INTERVAL = 150
+    
+    _QSS = """
+        QDialog#PreviewDialog {
+            background-color: #f5f5f5;
+        }
+        #PreviewDialog QLabel#preview_timestamp {
+            color: #666666;
+            padding: 5px;
+            border-bottom: 1px solid #eee;
+            font-size: 12px;
+        }
+        #PreviewDialog QPlainTextEdit#preview_text {
+            background-color: white;
+            padding: 20px;
+            border: 1px solid #eee;
+            border-radius: 5px;
+        }
+        #PreviewDialog QLabel#preview_info {
+            color: #666666;
+            padding: 5px;
+            font-size: 12px;
+        }
+        #PreviewDialog QScrollArea#preview_scroll {
+            background-color: #2d2d2d;
+            border: none;
+        }
+        #PreviewDialog QScrollArea#preview_scroll QScrollBar {
+            background-color: #2d2d2d;
+        }
+        #PreviewDialog QScrollArea#preview_scroll QScrollBar:handle {
+            background-color: #666666;
+        }
+        #PreviewDialog QWidget#preview_image,
+        #PreviewDialog QWidget#preview_image QLabel {
+            background-color: #2d2d2d;
+        }
+    """
+
+    def __init__(self, entry_id, content, content_type, timestamp=None, parent=None):
         super().__init__(parent)
+        self.setObjectName('PreviewDialog')
         self.setWindowTitle('Quick Look')
         
         # Get screen size for better initial sizing
@@ -122,93 +285,53 @@ class PreviewDialog(QDialog):
         # Add timestamp if available
         if timestamp:
             try:
-                # Handle both string and datetime timestamp formats
-                if isinstance(timestamp, str):
-                    utc_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    utc_dt = utc_dt.replace(tzinfo=timezone.utc)
-                else:
-                    utc_dt = timestamp.replace(tzinfo=timezone.utc)
-                
-                local_dt = utc_dt.astimezone()
-                timestamp_str = local_dt.strftime("%Y-%m-%d %I:%M:%S %p %Z")
+                timestamp_str = format_timestamp(timestamp)
                 
                 timestamp_label = QLabel(f"Created: {timestamp_str}")
+                timestamp_label.setObjectName('preview_timestamp')
                 timestamp_label.setAlignment(Qt.AlignCenter)
-                timestamp_label.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        padding: 5px;
-                        border-bottom: 1px solid #eee;
-                        font-size: 12px;
-                    }
-                """)
                 main_layout.addWidget(timestamp_label)
             except ValueError as e:
                 logging.error(f"Error parsing timestamp: {e}")
         
         if content_type == 'text':
-            scroll = QScrollArea()
-            text_widget = QLabel(content)
-            text_widget.setWordWrap(True)
-            text_widget.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            # QPlainTextEdit lays out only the visible lines, so large entries open instantly
+            text_widget = QPlainTextEdit()
+            text_widget.setObjectName('preview_text')
+            text_widget.setReadOnly(True)
+            text_widget.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+            text_widget.setPlainText(content)
             
             # Set proper font for text
             font = text_widget.font()
             font.setPointSize(12)
             text_widget.setFont(font)
             
-            # Style the text widget
-            text_widget.setStyleSheet("""
-                QLabel {
-                    background-color: white;
-                    padding: 20px;
-                    border: 1px solid #eee;
-                    border-radius: 5px;
-                }
-            """)
-            
-            scroll.setWidget(text_widget)
-            scroll.setWidgetResizable(True)
-            scroll.setStyleSheet("QScrollArea { border: none; }")
-            main_layout.addWidget(scroll)
+            main_layout.addWidget(text_widget)
         else:  # image
-            image_data = QByteArray.fromBase64(content.encode())
-            image = QImage.fromData(image_data)
+            self.content = content
+            self.entry_id = entry_id
+            self.original_size = image_size(content)
+            pixmap = self.fittedPixmap()
             
-            if not image.isNull():
+            if pixmap is not None:
                 # Create info label with dimensions
-                info_label = QLabel(f"Original Dimensions: {image.width()}x{image.height()} pixels")
+                size = self.original_size
+                info_label = QLabel(f"Original Dimensions: {size.width()}x{size.height()} pixels")
+                info_label.setObjectName('preview_info')
                 info_label.setAlignment(Qt.AlignCenter)
-                info_label.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        padding: 5px;
-                        font-size: 12px;
-                    }
-                """)
                 main_layout.addWidget(info_label)
                 
                 # Create scroll area with dark background
                 scroll = QScrollArea()
+                scroll.setObjectName('preview_scroll')
                 scroll.setWidgetResizable(True)
                 scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
                 scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-                scroll.setStyleSheet("""
-                    QScrollArea {
-                        background-color: #2d2d2d;
-                        border: none;
-                    }
-                    QScrollBar {
-                        background-color: #2d2d2d;
-                    }
-                    QScrollBar:handle {
-                        background-color: #666666;
-                    }
-                """)
                 
                 # Create image container with dark background
                 container = QWidget()
-                container.setStyleSheet("background-color: #2d2d2d;")
+                container.setObjectName('preview_image')
                 container_layout = QVBoxLayout(container)
                 container_layout.setContentsMargins(20, 20, 20, 20)
                 
@@ -216,32 +339,19 @@ class PreviewDialog(QDialog):
                 image_label = QLabel()
                 image_label.setAlignment(Qt.AlignCenter)
                 
-                # Calculate initial size while preserving aspect ratio
-                available_width = self.width() - 80  # Increased margins
-                available_height = self.height() - 120  # Increased margins
-                
-                # Create pixmap and store original
-                pixmap = QPixmap.fromImage(image)
-                self.original_pixmap = pixmap
-                
-                # Scale image to fit window while maintaining quality
-                if pixmap.width() > available_width or pixmap.height() > available_height:
-                    scaled_pixmap = pixmap.scaled(
-                        available_width,
-                        available_height,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                else:
-                    # If image is smaller than window, show at original size
-                    scaled_pixmap = pixmap
-                
-                image_label.setPixmap(scaled_pixmap)
+                # Already fitted to the window; smaller images show at original size
+                image_label.setPixmap(pixmap)
                 container_layout.addWidget(image_label, alignment=Qt.AlignCenter)
                 
-                # Store references for resize events
+                # Store the label for resize events
                 self.image_label = image_label
-                self.container = container
+                
+                # Refit only once resizing pauses, so dragging the window edge
+                # never runs a smooth scale per frame
+                self.resize_timer = QTimer(self)
+                self.resize_timer.setSingleShot(True)
+                self.resize_timer.setInterval(self.RESIZE_DEBOUNCE_INTERVAL)
+                self.resize_timer.timeout.connect(self.refitImage)
                 
                 scroll.setWidget(container)
                 main_layout.addWidget(scroll)
@@ -250,17 +360,96 @@ class PreviewDialog(QDialog):
                 main_layout.addWidget(error_label)
         
         self.setLayout(main_layout)
-        
-        # Style the dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f5f5;
-            }
-        """)
+    
+    def availableImageSize(self):
+        """Return the area the image may fill, leaving room for margins and labels."""
+        return self.width() - 80, self.height() - 120
+    
+    def fittedPixmap(self):
+        """Return the image scaled down to the available size, or None if it cannot be decoded."""
+        available_width, available_height = self.availableImageSize()
+        
+        # Reuse the fitted pixmap if this image was opened at this size before
+        key = f"preview:{self.entry_id}:{available_width}x{available_height}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            size = self.original_size
+            if size.isValid() and size.width() <= available_width and size.height() <= available_height:
+                # Shown at original size, so decode straight into a pixmap
+                pixmap = load_pixmap(self.content)
+            else:
+                image = load_image(self.content)
+                if not image.isNull():
+                    # Scale the decoded image before converting so pixels are copied once
+                    image = image.scaled(
+                        available_width,
+                        available_height,
+                        Qt.KeepAspectRatio,
+                        Qt.SmoothTransformation
+                    )
+                    pixmap = QPixmap.fromImage(image)
+            if pixmap is not None:
+                QPixmapCache.insert(key, pixmap)
+        self.fitted_size = (available_width, available_height)
+        return pixmap
+    
+    def refitImage(self):
+        """Rescale the shown image to the current window size."""
+        if self.availableImageSize() == self.fitted_size:
+            return
+        pixmap = self.fittedPixmap()
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if hasattr(self, 'resize_timer'):
+            self.resize_timer.start()
 
 class LoginDialog(QDialog):
+    _QSS = """
+        QDialog#LoginDialog {
+            background-color: white;
+        }
+        #LoginDialog QLabel {
+            font-size: 12px;
+            color: #2c3e50;
+            margin-bottom: 2px;
+        }
+        #LoginDialog QLineEdit {
+            padding: 8px;
+            border: 1px solid #bdc3c7;
+            border-radius: 4px;
+            margin-bottom: 10px;
+        }
+        #LoginDialog QCheckBox {
+            color: #2c3e50;
+            margin: 5px 0;
+        }
+        #LoginDialog QPushButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            padding: 8px;
+            border-radius: 4px;
+            margin: 5px;
+            min-width: 80px;
+        }
+        #LoginDialog QPushButton:hover {
+            background-color: #2980b9;
+        }
+        #LoginDialog QPushButton#register_btn {
+            background-color: #2ecc71;
+        }
+        #LoginDialog QPushButton#register_btn:hover {
+            background-color: #27ae60;
+        }
+    """
+    _settings = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName('LoginDialog')
         self.setWindowTitle('Clipboard Manager - Login')
         self.setFixedWidth(300)
         layout = QVBoxLayout()
@@ -306,58 +495,24 @@ class LoginDialog(QDialog):
         
         self.setLayout(layout)
         
-        # Style
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QLabel {
-                font-size: 12px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                margin-bottom: 10px;
-            }
-            QCheckBox {
-                color: #2c3e50;
-                margin: 5px 0;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                margin: 5px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton#register_btn {
-                background-color: #2ecc71;
-            }
-            QPushButton#register_btn:hover {
-                background-color: #27ae60;
-            }
-        """)
-        
         # Load remembered username if exists
         self.load_remembered_user()
     
+    @classmethod
+    def preferences(cls):
+        """Return the shared preferences store, opening it on first use."""
+        if cls._settings is None:
+            cls._settings = QSettings('ClipboardManager', 'UserPreferences')
+        return cls._settings
+    
     def load_remembered_user(self):
-        settings = QSettings('ClipboardManager', 'UserPreferences')
-        remembered_username = settings.value('remembered_username', '')
+        remembered_username = self.preferences().value('remembered_username', '')
         if remembered_username:
             self.username.setText(remembered_username)
             self.remember_me.setChecked(True)
     
     def save_remembered_user(self):
-        settings = QSettings('ClipboardManager', 'UserPreferences')
+        settings = self.preferences()
         if self.remember_me.isChecked():
             settings.setValue('remembered_username', self.username.text())
         else:
@@ -367,8 +522,43 @@ class LoginDialog(QDialog):
         self.done(2)  # Custom return code for registration
 
 class RegisterDialog(QDialog):
+    _QSS = """
+        QDialog#RegisterDialog {
+            background-color: white;
+        }
+        #RegisterDialog QLabel {
+            font-size: 12px;
+            color: #2c3e50;
+            margin-bottom: 2px;
+        }
+        #RegisterDialog QLineEdit {
+            padding: 8px;
+            border: 1px solid #bdc3c7;
+            border-radius: 4px;
+            margin-bottom: 10px;
+        }
+        #RegisterDialog QPushButton {
+            background-color: #2ecc71;
+            color: white;
+            border: none;
+            padding: 8px;
+            border-radius: 4px;
+            margin: 5px;
+        }
+        #RegisterDialog QPushButton:hover {
+            background-color: #27ae60;
+        }
+        #RegisterDialog QPushButton[text="Back to Login"] {
+            background-color: #95a5a6;
+        }
+        #RegisterDialog QPushButton[text="Back to Login"]:hover {
+            background-color: #7f8c8d;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName('RegisterDialog')
         self.setWindowTitle('Clipboard Manager - Register')
         self.setFixedWidth(300)
         layout = QVBoxLayout()
@@ -414,41 +604,6 @@ class RegisterDialog(QDialog):
         layout.addWidget(self.back_btn)
         
         self.setLayout(layout)
-        
-        # Style
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QLabel {
-                font-size: 12px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                margin-bottom: 10px;
-            }
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-            QPushButton[text="Back to Login"] {
-                background-color: #95a5a6;
-            }
-            QPushButton[text="Back to Login"]:hover {
-                background-color: #7f8c8d;
-            }
-        """)
     
     def register(self):
         if not self.username.text() or not self.password.text():
@@ -465,36 +620,397 @@ class RegisterDialog(QDialog):
             return
         self.accept()
 
-class ClipboardThread(QThread):
-    clipboard_changed = pyqtSignal()
+class ThumbnailSignals(QObject):
+    finished = pyqtSignal(int, QImage)
+
+class ThumbnailLoader(QRunnable):
+    """Decodes a stored thumbnail PNG on a pool thread."""
+    def __init__(self, entry_id, preview):
+        super().__init__()
+        self.entry_id = entry_id
+        self.preview = preview
+        self.signals = ThumbnailSignals()
+    
+    def run(self):
+        self.signals.finished.emit(self.entry_id, load_image(self.preview))
+
+class ClipboardHistoryModel(QAbstractListModel):
+    """List model over one session's clipboard history.
+    
+    Rows are read from SQLite a page at a time as the view asks for them, and
+    only the most recently used pages are kept in memory. Full entry content
+    is never loaded here; use entryContent() when it is actually needed.
+    """
+    PAGE_SIZE = 50
+    MAX_CACHED_PAGES = 4
+    MAX_CACHED_THUMBNAILS = 512
+    
+    def __init__(self, read_pool, parent=None):
+        super().__init__(parent)
+        self.read_pool = read_pool
+        self.session_id = None
+        self._row_count = 0
+        self._pages = OrderedDict()
+        # entry id -> thumbnail icon, least recently painted first
+        self._thumbnails = OrderedDict()
+        self._pending_thumbnails = set()
+    
+    def setSession(self, session_id):
+        """Point the model at a session (or None) and drop all cached rows."""
+        self.beginResetModel()
+        self.session_id = session_id
+        self._pages.clear()
+        self._row_count = 0
+        if session_id is not None:
+            with self.read_pool.cursor() as cursor:
+                cursor.execute('''
+                    SELECT COUNT(*) FROM clipboard_entries 
+                    WHERE session_id = ? AND is_deleted = 0
+                ''', (session_id,))
+                self._row_count = cursor.fetchone()[0]
+        self.endResetModel()
+    
+    def insertNewest(self, count=1):
+        """Account for entries just added to the top of the session.
+        
+        Cached pages are dropped since every row shifts down, but the view keeps
+        its selection and scroll position and no COUNT query is needed.
+        """
+        self.beginInsertRows(QModelIndex(), 0, count - 1)
+        self._row_count += count
+        self._pages.clear()
+        self.endInsertRows()
+    
+    def removeEntry(self, entry_id):
+        """Drop a just-deleted entry from the list.
+        
+        Returns False if the entry's row is not loaded, in which case the
+        caller has to reset the model instead.
+        """
+        row = self._rowOf(entry_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._row_count -= 1
+        self._pages.clear()
+        self.endRemoveRows()
+        return True
+    
+    def moveToTop(self, entry_id):
+        """Move a just-updated entry to the top of the list.
+        
+        Returns False if the entry's row is not loaded, in which case the
+        caller has to reset the model instead.
+        """
+        row = self._rowOf(entry_id)
+        if row is None:
+            return False
+        if row == 0:
+            self._pages.clear()
+            index = self.index(0, 0)
+            self.dataChanged.emit(index, index)
+        else:
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0)
+            self._pages.clear()
+            self.endMoveRows()
+        return True
+    
+    def clear(self):
+        """Empty the list after all of the session's entries were deleted."""
+        self.beginResetModel()
+        self._pages.clear()
+        self._row_count = 0
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._row_count
+    
+    def entryAt(self, row):
+        """Return (id, content_type, width, height, timestamp, preview) for a row."""
+        if row < 0 or row >= self._row_count:
+            return None
+        
+        page_number = row // self.PAGE_SIZE
+        page = self._pages.get(page_number)
+        if page is None:
+            previous = self._pages.get(page_number - 1)
+            with self.read_pool.cursor() as cursor:
+                if previous and len(previous) == self.PAGE_SIZE:
+                    # Continue from the previous page's last row instead of making
+                    # SQLite count its way past every earlier row
+                    last_id, _, _, _, last_timestamp, _ = previous[-1]
+                    cursor.execute('''
+                        SELECT id, content_type, width, height, timestamp, preview 
+                        FROM clipboard_entries 
+                        WHERE session_id = ? AND is_deleted = 0 
+                        AND (timestamp, id) < (?, ?) 
+                        ORDER BY timestamp DESC, id DESC 
+                        LIMIT ?
+                    ''', (self.session_id, last_timestamp, last_id, self.PAGE_SIZE))
+                else:
+                    cursor.execute('''
+                        SELECT id, content_type, width, height, timestamp, preview 
+                        FROM clipboard_entries 
+                        WHERE session_id = ? AND is_deleted = 0 
+                        ORDER BY timestamp DESC, id DESC 
+                        LIMIT ? OFFSET ?
+                    ''', (self.session_id, self.PAGE_SIZE, page_number * self.PAGE_SIZE))
+                page = cursor.fetchall()
+            self._pages[page_number] = page
+            if len(self._pages) > self.MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+        
+        offset = row - page_number * self.PAGE_SIZE
+        if offset >= len(page):
+            return None
+        return page[offset]
+    
+    def entryContent(self, entry_id):
+        """Load the full content of an entry."""
+        with self.read_pool.cursor() as cursor:
+            cursor.execute('SELECT data FROM clipboard_blobs WHERE entry_id = ?', (entry_id,))
+            result = cursor.fetchone()
+        return result[0] if result else None
+    
+    def entryTextHead(self, entry_id, length):
+        """Load at most the first length characters of a text entry."""
+        with self.read_pool.cursor() as cursor:
+            cursor.execute('SELECT substr(data, 1, ?) FROM clipboard_blobs WHERE entry_id = ?',
+                           (length, entry_id))
+            result = cursor.fetchone()
+        return result[0] if result else None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entryAt(index.row())
+        if entry is None:
+            return None
+        
+        entry_id, content_type, width, height, timestamp, preview = entry
+        if role == Qt.DisplayRole:
+            if content_type == 'image':
+                return f"[Image] {width}x{height}"
+            # One line per entry keeps every row the same height
+            return ' '.join(preview.split())
+        if role == Qt.DecorationRole:
+            if content_type == 'image' and preview is not None:
+                # Image entries never change, so the thumbnail can be cached by id
+                icon = self._thumbnails.get(entry_id)
+                if icon is None:
+                    self._requestThumbnail(entry_id, preview)
+                    return None
+                self._thumbnails.move_to_end(entry_id)
+                return icon
+            return None
+        if role == Qt.ToolTipRole:
+            return f"Type: {content_type}\nCopied on: {format_timestamp(timestamp)}"
+        if role == Qt.UserRole:
+            return entry_id
+        return None
+    
+    def _rowOf(self, entry_id):
+        """Return the row of an entry in the cached pages, or None."""
+        for page_number, page in self._pages.items():
+            for offset, entry in enumerate(page):
+                if entry[0] == entry_id:
+                    return page_number * self.PAGE_SIZE + offset
+        return None
+    
+    def _requestThumbnail(self, entry_id, preview):
+        """Decode a thumbnail in the background; the row repaints when it is ready."""
+        if entry_id in self._pending_thumbnails:
+            return
+        self._pending_thumbnails.add(entry_id)
+        loader = ThumbnailLoader(entry_id, preview)
+        loader.signals.finished.connect(self._onThumbnailLoaded)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _onThumbnailLoaded(self, entry_id, image):
+        self._pending_thumbnails.discard(entry_id)
+        if image.isNull():
+            return
+        self._thumbnails[entry_id] = QIcon(QPixmap.fromImage(image))
+        if len(self._thumbnails) > self.MAX_CACHED_THUMBNAILS:
+            self._thumbnails.popitem(last=False)
+        row = self._rowOf(entry_id)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+class HistoryListView(QListView):
+    """History list that reports where the mouse hovers.
+    
+    Movements of HOVER_THRESHOLD pixels or less are ignored, so the hover
+    preview timer is not restarted on every pixel of motion.
+    """
+    HOVER_THRESHOLD = 8
+    
+    hoverMoved = pyqtSignal(QModelIndex, QPoint)
+    hoverLeft = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.running = True
-        self.previous_content = None
+        self.setMouseTracking(True)
+        self._last_pos = None
+    
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        pos = event.pos()
+        if self._last_pos is not None and (pos - self._last_pos).manhattanLength() <= self.HOVER_THRESHOLD:
+            return
+        self._last_pos = pos
+        self.hoverMoved.emit(self.indexAt(pos), event.globalPos())
+    
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._last_pos = None
+        self.hoverLeft.emit()
+
+class ReadPool:
+    """A few read-only connections to the history database, shared by any thread.
+    
+    With WAL these read committed data alongside the writer without blocking it.
+    """
+    def __init__(self, path, size=READ_POOL_SIZE):
+        self._connections = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(
+                f'file:{path}?mode=ro',
+                uri=True,
+                check_same_thread=False
+            )
+            configure_connection(connection)
+            self._connections.put(connection)
+        self._size = size
+    
+    @contextlib.contextmanager
+    def cursor(self):
+        """Borrow a connection for the duration of a with block."""
+        connection = self._connections.get()
+        try:
+            yield connection.cursor()
+        finally:
+            self._connections.put(connection)
+    
+    def close(self):
+        for _ in range(self._size):
+            self._connections.get().close()
+
+class DBWriter(QThread):
+    """Runs database writes on a background thread over its own connection.
+    
+    Statements queued within COALESCE_SECONDS of each other are committed in one
+    transaction. Each queued unit runs under its own savepoint, so a failing unit
+    is dropped without taking the rest of the batch with it. Callbacks of the
+    units that succeeded are emitted through `committed`, so they run on the GUI
+    thread once the writes are visible to other connections.
+    """
+    COALESCE_SECONDS = 0.02
+    committed = pyqtSignal(object)
+    
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self._path = path
+        self._queue = queue.Queue()
+    
+    def enqueue(self, sql, params=(), callback=None, with_result=False):
+        self.enqueueMany([(sql, params)], callback, with_result)
+    
+    def enqueueMany(self, statements, callback=None, with_result=False):
+        """Queue (sql, params) pairs that must be committed together.
+        
+        With with_result, the callback is called with the lastrowid and
+        rowcount of the first statement.
+        """
+        self._queue.put((statements, callback, with_result))
+    
+    def stop(self):
+        """Write everything still queued, then end the thread."""
+        self._queue.put(None)
+        self.wait()
     
     def run(self):
-        clipboard = QApplication.clipboard()
-        while self.running:
+        # Transactions are managed explicitly below, one per batch
+        connection = sqlite3.connect(self._path, isolation_level=None)
+        configure_connection(connection)
+        # One cursor for the thread's lifetime; statements come from the connection's cache
+        cursor = connection.cursor()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.COALESCE_SECONDS
+            while batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                running = False
+                batch.pop()
+            if not batch:
+                continue
+            
+            callbacks = []
             try:
-                mime_data = clipboard.mimeData()
-                if mime_data.hasImage():
-                    image = clipboard.image()
-                    if image and image != self.previous_content:
-                        self.clipboard_changed.emit()
-                        self.previous_content = image
-                elif mime_data.hasText():
-                    text = mime_data.text()
-                    if text and text != self.previous_content:
-                        self.clipboard_changed.emit()
-                        self.previous_content = text
-                time.sleep(1)
-            except Exception as e:
-                logging.error(f"Error in clipboard thread: {e}")
-                time.sleep(1)
+                # Take the write lock up front so the batch never has to upgrade mid-way
+                cursor.execute('BEGIN IMMEDIATE')
+                for statements, callback, with_result in batch:
+                    cursor.execute('SAVEPOINT unit')
+                    try:
+                        for index, (sql, params) in enumerate(statements):
+                            cursor.execute(sql, params)
+                            if index == 0:
+                                result = (cursor.lastrowid, cursor.rowcount)
+                    except sqlite3.Error as e:
+                        # Undo only this unit; the rest of the batch still commits
+                        cursor.execute('ROLLBACK TO unit')
+                        cursor.execute('RELEASE unit')
+                        logging.error(f"Database error: {e}")
+                        continue
+                    cursor.execute('RELEASE unit')
+                    if callback is not None:
+                        callbacks.append(functools.partial(callback, *result) if with_result else callback)
+                cursor.execute('COMMIT')
+            except sqlite3.Error as e:
+                if connection.in_transaction:
+                    cursor.execute('ROLLBACK')
+                # The batch was rolled back, so there is nothing to refresh
+                logging.error(f"Database error: {e}")
+                continue
+            
+            if callbacks:
+                self.committed.emit(callbacks)
+        connection.close()
+
+class ImageEncodeSignals(QObject):
+    # PNG bytes, width, height, thumbnail PNG, capture time, content hash
+    finished = pyqtSignal(object, int, int, object, object, object)
+
+class ImageEncoder(QRunnable):
+    """Encodes a captured image and its thumbnail to PNG on a pool thread."""
+    def __init__(self, image, captured_at, content_hash):
+        super().__init__()
+        self.image = image
+        self.captured_at = captured_at
+        self.content_hash = content_hash
+        self.signals = ImageEncodeSignals()
     
-    def stop(self):
-        self.running = False
+    def run(self):
+        byte_array = QByteArray()
+        buffer = QBuffer(byte_array)
+        buffer.open(QBuffer.WriteOnly)
+        self.image.save(buffer, IMAGE_FORMAT, IMAGE_ENCODE_QUALITY)
+        self.signals.finished.emit(sqlite3.Binary(bytes(byte_array)), self.image.width(),
+                                   self.image.height(), make_thumbnail(self.image), self.captured_at,
+                                   self.content_hash)
 
 class ClipboardManagerV2(QMainWindow):
     def __init__(self):
@@ -508,23 +1024,21 @@ class ClipboardManagerV2(QMainWindow):
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
             
-        # Initialize settings
-        self.settings = QSettings('ClipboardManagerV2', 'Sessions')
-        
-        # Initialize database with timestamp handling
-        self.db_connection = sqlite3.connect(
-            'clipboard_manager_v2.db',
-            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-            check_same_thread=False
-        )
+        # Initialize database; timestamps are stored and read as plain integers
+        self.db_connection = sqlite3.connect(DB_PATH)
+        configure_connection(self.db_connection)
         
         self.current_session_id = None
         self.current_user_id = None
         self.current_username = None
-        self.clipboard_history = []
-        self.db_lock = threading.Lock()
-        
-        # Initialize settings
+        self._last_hash = None
+        self._last_image_key = None
+        # content hash -> (session_id, entry_id) of recently saved entries
+        self._recent_entries = OrderedDict()
+        # username -> (id, password_hash, salt), so login retries skip the lookup
+        self._user_cache = {}
+        
+        # Initialize settings; this store already holds last_session_id for existing installs
         self.settings = QSettings('Codeium', 'ClipboardManager')
         
         self.initDatabase()
@@ -532,6 +1046,13 @@ class ClipboardManagerV2(QMainWindow):
         # Show login dialog
         if not self.showLogin():
             sys.exit()
+        
+        # Background writes go through their own connection once the schema is
+        # ready; started only after login so cancelling leaves no thread running
+        self.db_writer = DBWriter(DB_PATH, self)
+        self.db_writer.committed.connect(self._onWritesCommitted)
+        self.db_writer.start()
+        self.read_pool = ReadPool(DB_PATH)
             
         self.setupUI()
         self.loadAvailableSessions()
@@ -541,6 +1062,7 @@ class ClipboardManagerV2(QMainWindow):
         self.hover_preview = HoverPreviewWindow()
         self.hover_timer = QTimer()
         self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(150)
         self.hover_timer.timeout.connect(self.showHoverPreview)
 
     def showLogin(self):
@@ -551,7 +1073,9 @@ class ClipboardManagerV2(QMainWindow):
             if result == QDialog.Accepted:
                 username = dialog.username.text()
                 password = dialog.password.text()
-                if self.validateUser(username, hash_password(password)):
+                if self.validateUser(username, password):
+                    # Don't keep password-derived digests around once logged in
+                    _pw_digest.cache_clear()
                     self.current_username = username
                     dialog.save_remembered_user()
                     self.setWindowTitle(f'Clipboard Manager V2 - {username}')
@@ -569,29 +1093,55 @@ class ClipboardManagerV2(QMainWindow):
             else:
                 return False
     
-    def validateUser(self, username, password_hash):
+    def validateUser(self, username, password):
         cursor = self.db_connection.cursor()
-        cursor.execute('SELECT id FROM users WHERE username = ? AND password_hash = ?',
-                      (username, password_hash))
-        result = cursor.fetchone()
-        if result:
-            self.current_user_id = result[0]
-            return True
-        return False
+        user = self._user_cache.get(username)
+        if user is None:
+            cursor.execute('SELECT id, password_hash, salt FROM users WHERE username = ?', (username,))
+            user = cursor.fetchone()
+            if not user:
+                return False
+            self._user_cache[username] = user
+        
+        user_id, stored_hash, salt = user
+        if salt is None:
+            # Accounts created before scrypt hold an unsalted SHA-256 digest,
+            # as hex text in the oldest ones; rehash them on a successful login
+            digest = _legacy_password_digest(password)
+            if isinstance(stored_hash, str):
+                digest = digest.hex()
+            if not hmac.compare_digest(stored_hash, digest):
+                return False
+            salt = os.urandom(PASSWORD_SALT_BYTES)
+            with self.db_connection:
+                cursor.execute('UPDATE users SET password_hash = ?, salt = ? WHERE id = ?',
+                               (hash_password(password, salt), salt, user_id))
+            self._user_cache.pop(username, None)
+        else:
+            if len(password) < PASSWORD_CACHE_MAX_LENGTH:
+                digest = _pw_digest(password, salt)
+            else:
+                digest = hash_password(password, salt)
+            if not hmac.compare_digest(stored_hash, digest):
+                return False
+        
+        self.current_user_id = user_id
+        return True
     
     def registerUser(self, username, password):
         cursor = self.db_connection.cursor()
-        try:
-            cursor.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)',
-                         (username, hash_password(password)))
-            self.db_connection.commit()
-            return True
-        except sqlite3.IntegrityError:
-            return False
+        salt = os.urandom(PASSWORD_SALT_BYTES)
+        # The UNIQUE username constraint turns a duplicate into a no-op
+        with self.db_connection:
+            cursor.execute('INSERT OR IGNORE INTO users (username, password_hash, salt) VALUES (?, ?, ?)',
+                         (username, hash_password(password, salt), salt))
+        self._user_cache.pop(username, None)
+        return cursor.rowcount == 1
 
     def setupUI(self):
         # Create central widget and main layout
         central_widget = QWidget()
+        central_widget.setObjectName('MainPanel')
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(10)
@@ -616,40 +1166,15 @@ class ClipboardManagerV2(QMainWindow):
 
         # Session header
         session_label = QLabel("Sessions")
-        session_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 5px 0;
-            }
-        """)
+        session_label.setObjectName('session_header')
         session_layout.addWidget(session_label)
         
         # Session list widget
         self.session_list = QListWidget()
+        self.session_list.setObjectName('session_list')
         self.session_list.setMinimumWidth(200)  # Set minimum width
         self.session_list.setMaximumWidth(300)  # Set maximum width
         self.session_list.itemClicked.connect(self.onSessionSelected)  # Add click handler
-        self.session_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #ecf0f1;
-            }
-            QListWidget::item:hover {
-                background-color: #ecf0f1;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-        """)
         session_layout.addWidget(self.session_list)
         
         # Add session widget to left side
@@ -663,46 +1188,21 @@ class ClipboardManagerV2(QMainWindow):
         buttons_layout.setContentsMargins(5, 5, 5, 5)
         buttons_layout.setAlignment(Qt.AlignTop)
 
-        # Button style
-        button_style = """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: 500;
-                font-size: 12px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #2473a6;
-            }
-        """
-
         # Create styled buttons
         self.new_session_btn = QPushButton('New Session')
-        self.new_session_btn.setStyleSheet(button_style)
         self.new_session_btn.clicked.connect(self.createNewSession)
         buttons_layout.addWidget(self.new_session_btn)
         
         self.rename_session_btn = QPushButton('Rename Session')
-        self.rename_session_btn.setStyleSheet(button_style)
         self.rename_session_btn.clicked.connect(self.renameSession)
         buttons_layout.addWidget(self.rename_session_btn)
         
         self.set_default_btn = QPushButton('Set as Default')
-        self.set_default_btn.setStyleSheet(button_style)
         self.set_default_btn.clicked.connect(self.setDefaultSession)
         buttons_layout.addWidget(self.set_default_btn)
         
         self.delete_session_btn = QPushButton('Delete Session')
-        self.delete_session_btn.setStyleSheet(button_style.replace("#3498db", "#e74c3c")
-                                                    .replace("#2980b9", "#c0392b")
-                                                    .replace("#2473a6", "#a93226"))
+        self.delete_session_btn.setProperty('danger', True)
         self.delete_session_btn.clicked.connect(self.deleteSession)
         buttons_layout.addWidget(self.delete_session_btn)
 
@@ -713,10 +1213,7 @@ class ClipboardManagerV2(QMainWindow):
         
         # Add quit button
         self.quit_btn = QPushButton('Quit')
-        quit_button_style = button_style.replace('#3498db', '#95a5a6')  \
-                                  .replace('#2980b9', '#7f8c8d')    \
-                                  .replace('#2473a6', '#6c7a7d')
-        self.quit_btn.setStyleSheet(quit_button_style)
+        self.quit_btn.setProperty('secondary', True)
         self.quit_btn.clicked.connect(self.close)  # Changed from QApplication.instance().quit to self.close
         buttons_layout.addWidget(self.quit_btn)
 
@@ -733,45 +1230,24 @@ class ClipboardManagerV2(QMainWindow):
         
         # History header with styling
         history_header = QLabel('Clipboard History')
-        history_header.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 5px;
-            }
-        """)
+        history_header.setObjectName('history_header')
         history_layout.addWidget(history_header)
         
         # History display
-        self.history_display = QListWidget()
-        self.history_display.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #ecf0f1;
-            }
-            QListWidget::item:hover {
-                background-color: #ecf0f1;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-        """)
-        
-        # Enable mouse tracking for hover preview
-        self.history_display.setMouseTracking(True)
-        self.history_display.viewport().installEventFilter(self)
+        self.history_model = ClipboardHistoryModel(self.read_pool, self)
+        self.history_display = HistoryListView()
+        self.history_display.setObjectName('history_list')
+        self.history_display.setModel(self.history_model)
+        # Rows are single-line, so the view can size them all from the first one
+        self.history_display.setUniformItemSizes(True)
+        
+        # Show a hover preview once the mouse settles on an entry
+        self.history_display.hoverMoved.connect(self.onHistoryHover)
+        self.history_display.hoverLeft.connect(self.onHistoryHoverLeft)
         
         # Connect signals
-        self.history_display.itemDoubleClicked.connect(self.previewSelectedItem)
-        self.history_display.itemActivated.connect(self.previewSelectedItem)
+        self.history_display.doubleClicked.connect(self.previewSelectedItem)
+        self.history_display.activated.connect(self.previewSelectedItem)
         self.history_display.keyPressEvent = self.historyKeyPressEvent
         
         history_layout.addWidget(self.history_display)
@@ -780,16 +1256,12 @@ class ClipboardManagerV2(QMainWindow):
         history_buttons = QHBoxLayout()
         
         self.delete_entry_button = QPushButton('Delete Entry')
-        self.delete_entry_button.setStyleSheet(button_style.replace("#3498db", "#e74c3c")
-                                                    .replace("#2980b9", "#c0392b")
-                                                    .replace("#2473a6", "#a93226"))
+        self.delete_entry_button.setProperty('danger', True)
         self.delete_entry_button.clicked.connect(self.deleteClipboardEntry)
         history_buttons.addWidget(self.delete_entry_button)
         
         self.clear_history_button = QPushButton('Clear History')
-        self.clear_history_button.setStyleSheet(button_style.replace("#3498db", "#e74c3c")
-                                                    .replace("#2980b9", "#c0392b")
-                                                    .replace("#2473a6", "#a93226"))
+        self.clear_history_button.setProperty('danger', True)
         self.clear_history_button.clicked.connect(self.clearClipboardHistory)
         history_buttons.addWidget(self.clear_history_button)
         
@@ -804,17 +1276,18 @@ class ClipboardManagerV2(QMainWindow):
         self.history_display.customContextMenuRequested.connect(self.showContextMenu)
 
     def onSessionSelected(self, item):
+        """Handle session selection and save the selection to settings"""
         if item is None:
             return
         
         session_id = item.data(Qt.UserRole)
         self.current_session_id = session_id
+        # Written to disk by QSettings in the background and on exit
         self.settings.setValue('last_session_id', session_id)
-        self.settings.sync()
         self.loadSession()
         
         # Update session label in status bar
-        session_name = item.text().replace('★ ', '')  # Remove star if present
+        session_name = item.data(SESSION_NAME_ROLE)
         self.session_label.setText(f"Current Session: {session_name}")
         logging.debug(f"Session selected: {session_id}")
 
@@ -864,7 +1337,7 @@ class ClipboardManagerV2(QMainWindow):
         if not current_item:
             logging.debug("No session selected to rename.")
             return
-        old_name = current_item.text().replace('★ ', '')
+        old_name = current_item.data(SESSION_NAME_ROLE)
         new_name, ok = QInputDialog.getText(self, 'Rename Session', 'Enter new name:')
         if ok and new_name:
             cursor = self.db_connection.cursor()
@@ -881,81 +1354,71 @@ class ClipboardManagerV2(QMainWindow):
         if current_item is None:
             return
         
-        session_name = current_item.text().replace('★ ', '')
-        cursor = self.db_connection.cursor()
+        session_id = current_item.data(Qt.UserRole)
+        self._forgetRecentEntries(lambda session, _: session == session_id)
         
-        # Soft delete the session
-        cursor.execute('UPDATE sessions SET is_deleted = 1 WHERE name = ? AND user_id = ?', (session_name, self.current_user_id))
-        # Soft delete all clipboard entries in this session
-        cursor.execute('''
-            UPDATE clipboard_entries 
-            SET is_deleted = 1 
-            WHERE session_id IN (SELECT id FROM sessions WHERE name = ? AND user_id = ?)
-        ''', (session_name, self.current_user_id))
+        # Soft delete the session and all of its clipboard entries
+        self.db_writer.enqueueMany([
+            ('UPDATE clipboard_entries SET is_deleted = 1 WHERE session_id = ? AND is_deleted = 0', (session_id,)),
+            ('UPDATE sessions SET is_deleted = 1 WHERE id = ?', (session_id,)),
+        ], callback=self.loadAvailableSessions)
         
-        self.db_connection.commit()
-        self.loadAvailableSessions()
         self.current_session_id = None
-        self.clipboard_history.clear()
-        self.updateHistoryDisplay()
+        self.history_model.setSession(None)
 
     def deleteClipboardEntry(self):
-        current_item = self.history_display.currentItem()
-        if current_item is None:
-            return
-
-        row = self.history_display.row(current_item)
-        if 0 <= row < len(self.clipboard_history):
-            content, _, _, _, _ = self.clipboard_history[row]
-            cursor = self.db_connection.cursor()
-            cursor.execute('''
-                UPDATE clipboard_entries 
-                SET is_deleted = 1 
-                WHERE content = ? AND session_id = ? 
-                AND timestamp = (
-                    SELECT timestamp 
-                    FROM clipboard_entries 
-                    WHERE content = ? 
-                    AND session_id = ? 
-                    AND is_deleted = 0 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                )
-            ''', (content, self.current_session_id, content, self.current_session_id))
-            self.db_connection.commit()
-            self.loadClipboardHistory()
+        entry = self.history_model.entryAt(self.history_display.currentIndex().row())
+        if entry is not None:
+            self._forgetRecentEntries(lambda _, entry_id: entry_id == entry[0])
+            self.db_writer.enqueue('UPDATE clipboard_entries SET is_deleted = 1 WHERE id = ?',
+                                   (entry[0],), callback=functools.partial(
+                                       self._onEntryDeleted, self.current_session_id, entry[0]))
 
     def clearClipboardHistory(self):
         if self.current_session_id is None:
             return
 
-        cursor = self.db_connection.cursor()
-        cursor.execute('''
+        session_id = self.current_session_id
+        self._forgetRecentEntries(lambda session, _: session == session_id)
+        self.db_writer.enqueue('''
             UPDATE clipboard_entries 
             SET is_deleted = 1 
             WHERE session_id = ? AND is_deleted = 0
-        ''', (self.current_session_id,))
-        self.db_connection.commit()
-        self.loadClipboardHistory()
+        ''', (self.current_session_id,), callback=functools.partial(
+            self._onHistoryCleared, self.current_session_id))
+    
+    def _onEntryDeleted(self, session_id, entry_id):
+        # Remove just that row; fall back to a reload if it is not loaded
+        if session_id == self.history_model.session_id and not self.history_model.removeEntry(entry_id):
+            self.loadClipboardHistory()
+    
+    def _onEntryModified(self, session_id, entry_id):
+        # An edit gives the entry a new timestamp, so it moves to the top
+        if session_id == self.history_model.session_id and not self.history_model.moveToTop(entry_id):
+            self.loadClipboardHistory()
+    
+    def _onHistoryCleared(self, session_id):
+        if session_id == self.history_model.session_id:
+            self.history_model.clear()
 
     def loadAvailableSessions(self):
         """Load available sessions and set the last used or default session"""
         try:
-            with self.db_lock:
-                cursor = self.db_connection.cursor()
-                cursor.execute("""
-                    SELECT id, name, is_default 
-                    FROM sessions 
-                    WHERE is_deleted = 0 AND user_id = ?
-                    ORDER BY name
-                """, (self.current_user_id,))
-                sessions = cursor.fetchall()
+            cursor = self.db_connection.cursor()
+            cursor.execute("""
+                SELECT id, name, is_default 
+                FROM sessions 
+                WHERE is_deleted = 0 AND user_id = ?
+                ORDER BY name
+            """, (self.current_user_id,))
+            sessions = cursor.fetchall()
 
             # Clear and populate sessions combo box
             self.session_list.clear()
             for session_id, name, is_default in sessions:
                 item = QListWidgetItem(f"{'★ ' if is_default else ''}{name}")
                 item.setData(Qt.UserRole, session_id)
+                item.setData(SESSION_NAME_ROLE, name)
                 self.session_list.addItem(item)
 
             if not sessions:
@@ -966,19 +1429,15 @@ class ClipboardManagerV2(QMainWindow):
             
             if last_session_id is not None:
                 # Find the index of the last used session
-                for i in range(self.session_list.count()):
-                    item = self.session_list.item(i)
-                    if item.data(Qt.UserRole) == last_session_id:
-                        self.session_list.setCurrentItem(item)
+                for row, (session_id, _, _) in enumerate(sessions):
+                    if session_id == last_session_id:
+                        self.session_list.setCurrentRow(row)
                         return
 
-            # Try to find and set the default session
-            for i in range(self.session_list.count()):
-                item = self.session_list.item(i)
-                cursor.execute("SELECT is_default FROM sessions WHERE id = ?", (item.data(Qt.UserRole),))
-                result = cursor.fetchone()
-                if result and result[0]:
-                    self.session_list.setCurrentItem(item)
+            # Try to find and set the default session; is_default was fetched above
+            for row, (_, _, is_default) in enumerate(sessions):
+                if is_default:
+                    self.session_list.setCurrentRow(row)
                     return
 
             # If no last used or default session, set to the first one
@@ -988,17 +1447,6 @@ class ClipboardManagerV2(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load sessions: {str(e)}")
 
-    def onSessionSelected(self, item):
-        """Handle session selection and save the selection to settings"""
-        if item is None:
-            return
-        
-        session_id = item.data(Qt.UserRole)
-        self.current_session_id = session_id
-        self.settings.setValue('last_session_id', session_id)
-        self.settings.sync()
-        self.loadSession()
-
     def loadSession(self):
         current_item = self.session_list.currentItem()
         if current_item is None:
@@ -1012,7 +1460,7 @@ class ClipboardManagerV2(QMainWindow):
         self.current_session_id = session_id
         
         # Update window title with session name
-        session_name = current_item.text().replace('★ ', '')
+        session_name = current_item.data(SESSION_NAME_ROLE)
         self.setWindowTitle(f"Clipboard Manager V2 - {session_name}")  # Updated format
         
         # Load clipboard history for this session
@@ -1023,158 +1471,252 @@ class ClipboardManagerV2(QMainWindow):
         self.statusBar().showMessage(f'Switched to session: {session_name}', 2000)
 
     def startClipboardMonitor(self):
-        self.clipboard_thread = ClipboardThread(self)
-        self.clipboard_thread.clipboard_changed.connect(self.onClipboardChanged)
-        self.clipboard_thread.start()
+        # Apps often announce several changes per copy; only capture the final state
+        self._clip_debounce = QTimer(self)
+        self._clip_debounce.setSingleShot(True)
+        self._clip_debounce.setInterval(CLIPBOARD_DEBOUNCE_INTERVAL)
+        self._clip_debounce.timeout.connect(self.onClipboardChanged)
+        QApplication.clipboard().dataChanged.connect(self._clip_debounce.start)
+        
+        # Cocoa only reports pasteboard changes when the app is activated, so
+        # poll for text copied while the window is in the background
+        if sys.platform == 'darwin':
+            self._cb_timer = QTimer(self)
+            self._cb_timer.timeout.connect(self._pollClipboard)
+            self._cb_timer.start(CLIPBOARD_POLL_INTERVAL)
+
+    def _pollClipboard(self):
+        if QApplication.applicationState() == Qt.ApplicationActive:
+            return  # dataChanged is delivered while active
+        mime_data = QApplication.clipboard().mimeData()
+        # Images are picked up by dataChanged on activation; converting them
+        # here on every tick would cost a full decode
+        if mime_data is not None and mime_data.hasText() and not mime_data.hasImage():
+            self.onClipboardChanged()
 
     def onClipboardChanged(self):
         clipboard = QApplication.clipboard()
         mime_data = clipboard.mimeData()
+        if mime_data is None:
+            return
         
         if mime_data.hasImage():
             image = clipboard.image()
             if image and not image.isNull():
-                byte_array = QByteArray()
-                buffer = QBuffer(byte_array)
-                buffer.open(QBuffer.WriteOnly)
-                image.save(buffer, 'PNG')
-                image_data = byte_array.toBase64().data().decode()
-                self.saveClipboardContent(image_data, 'image', image.width(), image.height())
+                # Same QImage as last time; skip hashing its pixels
+                if image.cacheKey() == self._last_image_key:
+                    return
+                self._last_image_key = image.cacheKey()
+                # Apps often re-set identical images, so compare pixels before encoding
+                content_hash = image_digest(image)
+                if content_hash == self._last_hash:
+                    return
+                self._last_hash = content_hash
+                captured_at = datetime.now(timezone.utc)
+                save = functools.partial(self._encodeImage, image, captured_at, content_hash)
+                if not self._reuseRecentEntry(content_hash, captured_at, save):
+                    save()
         
         elif mime_data.hasText():
-            text = mime_data.text()
-            if text:
-                self.saveClipboardContent(text, 'text')
+            # Hash the clipboard's UTF-8 bytes in place; the Python string is
+            # only built once the text turns out to be new
+            data = mime_data.data('text/plain')
+            if data.isEmpty():
+                data = mime_data.text().encode()
+            if data:
+                content_hash = hashlib.blake2b(data, digest_size=16).digest()
+                if content_hash == self._last_hash:
+                    return
+                self._last_hash = content_hash
+                text = mime_data.text()
+                if text:
+                    captured_at = datetime.now(timezone.utc)
+                    save = functools.partial(self.saveClipboardContent, text, 'text',
+                                             captured_at=captured_at, content_hash=content_hash)
+                    if not self._reuseRecentEntry(content_hash, captured_at, save):
+                        save()
+
+    def _reuseRecentEntry(self, content_hash, captured_at, save):
+        """Move a recently saved copy of this content to the top instead of saving it again.
+        
+        Returns True if an existing entry's bump was queued. Should the entry
+        turn out to be gone when the bump runs, `save` is called instead.
+        """
+        recent = self._recent_entries.get(content_hash)
+        if recent is None or recent[0] != self.current_session_id:
+            return False
+        session_id, entry_id = recent
+        self.db_writer.enqueue(
+            'UPDATE clipboard_entries SET timestamp = ? WHERE id = ? AND is_deleted = 0',
+            (captured_at, entry_id), callback=functools.partial(
+                self._onEntryBumped, session_id, entry_id, content_hash, save), with_result=True)
+        self._recent_entries.move_to_end(content_hash)
+        return True
+
+    def _rememberRecentEntry(self, content_hash, session_id, entry_id):
+        self._recent_entries[content_hash] = (session_id, entry_id)
+        self._recent_entries.move_to_end(content_hash)
+        if len(self._recent_entries) > RECENT_ENTRIES_LIMIT:
+            self._recent_entries.popitem(last=False)
+
+    def _forgetRecentEntries(self, predicate):
+        """Drop the recent entries for which predicate(session_id, entry_id) holds."""
+        for content_hash, (session_id, entry_id) in list(self._recent_entries.items()):
+            if predicate(session_id, entry_id):
+                del self._recent_entries[content_hash]
+
+    def _onEntryBumped(self, session_id, entry_id, content_hash, save, _, rowcount):
+        if rowcount == 0:
+            # Deleted or edited since it was remembered; capture it as a new entry
+            if self._recent_entries.get(content_hash) == (session_id, entry_id):
+                del self._recent_entries[content_hash]
+            save()
+            return
+        # Move the row up in place; fall back to a reload if it is not loaded
+        if session_id == self.history_model.session_id and not self.history_model.moveToTop(entry_id):
+            self.loadClipboardHistory()
+
+    def _encodeImage(self, image, captured_at, content_hash):
+        # PNG encoding takes tens of milliseconds on large images; keep it off the GUI thread
+        encoder = ImageEncoder(image, captured_at, content_hash)
+        encoder.signals.finished.connect(self._onImageEncoded)
+        QThreadPool.globalInstance().start(encoder)
+
+    def _onImageEncoded(self, image_data, width, height, preview, captured_at, content_hash):
+        self.saveClipboardContent(image_data, 'image', width, height, preview=preview,
+                                  captured_at=captured_at, content_hash=content_hash)
 
-    def saveClipboardContent(self, content, content_type='text', width=None, height=None):
+    def saveClipboardContent(self, content, content_type='text', width=None, height=None, preview=None,
+                             captured_at=None, content_hash=None):
         if self.current_session_id is None:
             logging.info("Please select a session to save clipboard content")
             return
             
-        try:
-            with self.db_lock:
-                cursor = self.db_connection.cursor()
-                now = datetime.now(timezone.utc)
-                
-                cursor.execute('''
-                    INSERT INTO clipboard_entries 
-                    (session_id, content, content_type, width, height, timestamp) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (self.current_session_id, content, content_type, width, height, now))
-                
-                self.db_connection.commit()
-                logging.debug(f"Saved {content_type} to session {self.current_session_id}")
-                
-                # Reload clipboard history to show new entry
-                self.loadClipboardHistory()
-                
-        except sqlite3.Error as e:
-            logging.error(f"Database error: {e}")
-        except Exception as e:
-            logging.error(f"Error: {e}")
+        now = captured_at or datetime.now(timezone.utc)
+        if preview is None and content_type == 'text':
+            preview = content[:TEXT_PREVIEW_LENGTH]
+            
+        # One unit, so the blob's last_insert_rowid() always names this entry
+        # and both commit together; show the new entry once they have
+        self.db_writer.enqueueMany([
+            ('''
+                INSERT INTO clipboard_entries 
+                (session_id, content_type, width, height, timestamp, preview) 
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (self.current_session_id, content_type, width, height, now, preview)),
+            ('INSERT INTO clipboard_blobs (entry_id, data) VALUES (last_insert_rowid(), ?)', (content,)),
+        ], callback=functools.partial(self._onEntrySaved, self.current_session_id, content_hash),
+           with_result=True)
+        logging.debug(f"Saved {content_type} to session {self.current_session_id}")
+
+    def _onEntrySaved(self, session_id, content_hash, entry_id, _):
+        # Only a committed entry can be bumped by a later copy of the same content
+        if content_hash is not None:
+            self._rememberRecentEntry(content_hash, session_id, entry_id)
+        # Grow the list in place rather than re-querying the whole session
+        if session_id == self.history_model.session_id:
+            self.history_model.insertNewest()
+
+    def _onWritesCommitted(self, callbacks):
+        """Run the callbacks of a committed write batch, each only once."""
+        for callback in dict.fromkeys(callbacks):
+            callback()
 
     def loadClipboardHistory(self):
         try:
             if self.current_session_id is None:
                 return
-                
-            cursor = self.db_connection.cursor()
-            cursor.execute('''
-                SELECT content, content_type, width, height, timestamp 
-                FROM clipboard_entries 
-                WHERE session_id = ? AND is_deleted = 0 
-                ORDER BY timestamp DESC
-            ''', (self.current_session_id,))
             
-            entries = cursor.fetchall()
-            self.clipboard_history = entries
-            self.updateHistoryDisplay()
+            # The model reads rows lazily as the view scrolls
+            self.history_model.setSession(self.current_session_id)
             
         except sqlite3.Error as e:
             logging.error(f"Error loading clipboard history: {e}")
             self.statusBar().showMessage("Error loading clipboard history", 2000)
 
-    def updateHistoryDisplay(self):
-        self.history_display.clear()
-        for content, content_type, width, height, timestamp in self.clipboard_history:
-            item = QListWidgetItem()
-            if content_type == 'image':
-                item.setText(f"[Image] {width}x{height}")
-                # Create thumbnail
-                image_data = QByteArray.fromBase64(content.encode())
-                image = QImage.fromData(image_data)
-                pixmap = QPixmap.fromImage(image).scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                item.setIcon(QIcon(pixmap))
-            else:
-                item.setText(str(content))
-            
-            item.setToolTip(f"Type: {content_type}\nCopied on: {timestamp}")
-            self.history_display.addItem(item)
-
     def previewSelectedItem(self):
-        current_item = self.history_display.currentItem()
-        if current_item is None:
-            return
-        
-        row = self.history_display.row(current_item)
-        if row < 0 or row >= len(self.clipboard_history):
+        entry = self.history_model.entryAt(self.history_display.currentIndex().row())
+        if entry is None:
             return
         
-        content, content_type, width, height, timestamp = self.clipboard_history[row]
-        dialog = PreviewDialog(content, content_type, timestamp, self)
+        entry_id, content_type, width, height, timestamp, _ = entry
+        content = self.history_model.entryContent(entry_id)
+        dialog = PreviewDialog(entry_id, content, content_type, timestamp, self)
         dialog.exec_()
 
+    def onHistoryHover(self, index, global_pos):
+        self.hover_preview.hide()
+        self.hover_index = index
+        self.hover_pos = global_pos
+        if index.isValid():
+            self.hover_timer.start()
+        else:
+            self.hover_timer.stop()
+
+    def onHistoryHoverLeft(self):
+        self.hover_timer.stop()
+        self.hover_index = QModelIndex()
+        self.hover_preview.hide()
+
     def showHoverPreview(self):
         try:
-            if not hasattr(self, 'hover_item') or not self.hover_item:
+            if not hasattr(self, 'hover_index') or not self.hover_index.isValid():
                 return
                 
-            row = self.history_display.row(self.hover_item)
-            if row < 0 or row >= len(self.clipboard_history):
+            entry = self.history_model.entryAt(self.hover_index.row())
+            if entry is None:
                 return
             
-            content, content_type, _, _, _ = self.clipboard_history[row]
+            entry_id, content_type, _, _, _, _ = entry
+            cache_key = None
+            if content_type == 'image':
+                # A previously hovered image needs neither its BLOB nor a decode
+                cache_key = f"hover:{entry_id}"
+                pixmap = QPixmapCache.find(cache_key)
+                if pixmap is not None:
+                    self.hover_preview.showPixmap(pixmap, self.hover_pos)
+                    return
+                content = self.history_model.entryContent(entry_id)
+            else:
+                # One character past the cut-off is enough to know whether to add "..."
+                content = self.history_model.entryTextHead(entry_id, TEXT_PREVIEW_LENGTH + 1)
+            
             if content and content_type:
-                self.hover_preview.showPreview(content, content_type, self.hover_pos)
+                self.hover_preview.showPreview(content, content_type, self.hover_pos, cache_key)
         except (RuntimeError, AttributeError, IndexError) as e:
             logging.debug(f"Hover preview error: {e}")
             # Safely clear hover state
-            self.hover_item = None
+            self.hover_index = QModelIndex()
             if hasattr(self, 'hover_preview'):
                 self.hover_preview.hide()
 
     def copySelectedToClipboard(self):
         try:
-            current_item = self.history_display.currentItem()
-            if not current_item:
-                return
-                
-            row = self.history_display.row(current_item)
-            if row < 0 or row >= len(self.clipboard_history):
+            entry = self.history_model.entryAt(self.history_display.currentIndex().row())
+            if entry is None:
                 return
             
-            content, content_type, _, _, _ = self.clipboard_history[row]
+            entry_id, content_type, _, _, _, _ = entry
+            content = self.history_model.entryContent(entry_id)
             clipboard = QApplication.clipboard()
             
-            # Temporarily disconnect the clipboard monitor to prevent recursive updates
-            if hasattr(self, 'clipboard_thread'):
-                self.clipboard_thread.running = False
-                self.clipboard_thread.wait()
-            
             try:
+                # Record what we copy the same way a capture would, so neither
+                # dataChanged nor the macOS poll saves it as a new entry
                 if content_type == 'text':
+                    self._last_hash = hashlib.blake2b(content.encode(), digest_size=16).digest()
                     clipboard.setText(content)
                 elif content_type == 'image':
-                    if isinstance(content, str):  # Base64 encoded image
-                        image_data = base64.b64decode(content)
-                        image = QImage()
-                        image.loadFromData(image_data)
-                        clipboard.setImage(image)
+                    if isinstance(content, (bytes, str)):  # PNG BLOB or legacy base64 text
+                        image = load_image(content)
                     elif isinstance(content, QImage):  # QImage object
-                        clipboard.setImage(content)
+                        image = content
                     else:
                         logging.error(f"Unsupported image content type: {type(content)}")
                         return
+                    self._last_image_key = image.cacheKey()
+                    self._last_hash = image_digest(image)
+                    clipboard.setImage(image)
                 
                 # Update status bar
                 self.statusBar().showMessage('Copied to clipboard!', 2000)
@@ -1183,12 +1725,6 @@ class ClipboardManagerV2(QMainWindow):
             except Exception as e:
                 logging.error(f"Error copying to clipboard: {e}")
                 self.statusBar().showMessage('Failed to copy to clipboard', 2000)
-            
-            finally:
-                # Restart the clipboard monitor
-                if hasattr(self, 'clipboard_thread'):
-                    self.clipboard_thread.running = True
-                    self.clipboard_thread.start()
                 
         except Exception as e:
             logging.error(f"Error in copySelectedToClipboard: {e}")
@@ -1198,29 +1734,13 @@ class ClipboardManagerV2(QMainWindow):
         if not self.current_session_id:
             return
             
-        try:
-            cursor = self.db_connection.cursor()
-            # Clear any existing default
-            cursor.execute('''
-                UPDATE sessions 
-                SET is_default = 0 
-                WHERE user_id = ?
-            ''', (self.current_user_id,))
-            
-            # Set new default
-            cursor.execute('''
-                UPDATE sessions 
-                SET is_default = 1 
-                WHERE id = ? AND user_id = ?
-            ''', (self.current_session_id, self.current_user_id))
-            
-            self.db_connection.commit()
-            self.loadAvailableSessions()
-            QMessageBox.information(self, "Success", "Default session updated!")
-            
-        except sqlite3.Error as e:
-            logging.error(f"Error setting default session: {e}")
-            QMessageBox.warning(self, "Error", "Failed to set default session")
+        # Flag the selected session and clear every other default in one pass
+        self.db_writer.enqueue('''
+            UPDATE sessions 
+            SET is_default = CASE WHEN id = ? THEN 1 ELSE 0 END 
+            WHERE user_id = ?
+        ''', (self.current_session_id, self.current_user_id), callback=self.loadAvailableSessions)
+        QMessageBox.information(self, "Success", "Default session updated!")
 
     def keyPressEvent(self, event):
         # Handle Cmd+C (or Ctrl+C) to copy selected item
@@ -1237,11 +1757,14 @@ class ClipboardManagerV2(QMainWindow):
             self.copySelectedToClipboard()
         else:
             # Call the parent class's keyPressEvent for other keys
-            QListWidget.keyPressEvent(self.history_display, event)
+            QListView.keyPressEvent(self.history_display, event)
 
     def initDatabase(self):
         try:
             cursor = self.db_connection.cursor()
+            # Create or upgrade the schema in one transaction, so an interrupted
+            # upgrade leaves the previous version intact
+            cursor.execute('BEGIN IMMEDIATE')
             
             # Check if we need to migrate by looking for the users table
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
@@ -1259,7 +1782,8 @@ class ClipboardManagerV2(QMainWindow):
                     CREATE TABLE users (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         username TEXT UNIQUE NOT NULL,
-                        password_hash TEXT NOT NULL,
+                        password_hash BLOB NOT NULL,
+                        salt BLOB,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
@@ -1283,38 +1807,144 @@ class ClipboardManagerV2(QMainWindow):
                     CREATE TABLE clipboard_entries (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         session_id INTEGER NOT NULL,
-                        content TEXT NOT NULL,
                         content_type TEXT NOT NULL,
                         width INTEGER,
                         height INTEGER,
-                        timestamp TIMESTAMP NOT NULL,
+                        timestamp INTEGER NOT NULL,
                         is_deleted BOOLEAN DEFAULT 0,
+                        preview BLOB,
                         FOREIGN KEY (session_id) REFERENCES sessions (id)
                     )
                 ''')
                 
-                self.db_connection.commit()
+                # Full entry content lives in its own table so history rows stay small
+                cursor.execute('''
+                    CREATE TABLE clipboard_blobs (
+                        entry_id INTEGER PRIMARY KEY,
+                        data BLOB NOT NULL,
+                        FOREIGN KEY (entry_id) REFERENCES clipboard_entries (id)
+                    )
+                ''')
+                
+                cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
                 logging.info("Database migration completed successfully")
             
+            cursor.execute('PRAGMA user_version')
+            schema_version = cursor.fetchone()[0]
+            
+            if schema_version < 1:
+                # Timestamps used to be stored as UTC text; convert them to Unix seconds
+                cursor.execute('''
+                    UPDATE clipboard_entries
+                    SET timestamp = CAST(strftime('%s', substr(timestamp, 1, 19)) AS INTEGER)
+                    WHERE typeof(timestamp) = 'text'
+                ''')
+                cursor.execute('PRAGMA user_version = 1')
+                logging.info("Converted clipboard timestamps to Unix time")
+            
+            if schema_version < 2:
+                # Lightweight previews let the history list render without loading full content
+                cursor.execute('ALTER TABLE clipboard_entries ADD COLUMN preview BLOB')
+                cursor.execute('''
+                    UPDATE clipboard_entries SET preview = substr(content, 1, ?)
+                    WHERE content_type = 'text'
+                ''', (TEXT_PREVIEW_LENGTH,))
+                cursor.execute("SELECT id, content FROM clipboard_entries WHERE content_type = 'image'")
+                thumbnails = []
+                for entry_id, content in cursor.fetchall():
+                    image = load_image(content)
+                    if not image.isNull():
+                        thumbnails.append((make_thumbnail(image), entry_id))
+                cursor.executemany('UPDATE clipboard_entries SET preview = ? WHERE id = ?', thumbnails)
+                cursor.execute('PRAGMA user_version = 2')
+                logging.info("Added previews to clipboard history")
+            
+            if schema_version < 3:
+                # Move full content out of clipboard_entries so listing history
+                # never has to page through large payloads
+                cursor.execute('''
+                    CREATE TABLE clipboard_blobs (
+                        entry_id INTEGER PRIMARY KEY,
+                        data BLOB NOT NULL,
+                        FOREIGN KEY (entry_id) REFERENCES clipboard_entries (id)
+                    )
+                ''')
+                cursor.execute('''
+                    INSERT INTO clipboard_blobs (entry_id, data)
+                    SELECT id, content FROM clipboard_entries
+                ''')
+                cursor.execute('ALTER TABLE clipboard_entries DROP COLUMN content')
+                cursor.execute('PRAGMA user_version = 3')
+                logging.info("Moved clipboard content into clipboard_blobs")
+            
+            if schema_version < 4:
+                # Images saved before PNG bytes were stored directly are base64 text
+                cursor.execute('''
+                    SELECT b.entry_id, b.data 
+                    FROM clipboard_blobs b 
+                    JOIN clipboard_entries e ON e.id = b.entry_id 
+                    WHERE e.content_type = 'image' AND typeof(b.data) = 'text'
+                ''')
+                decoded = []
+                for entry_id, data in cursor.fetchall():
+                    try:
+                        decoded.append((sqlite3.Binary(base64.b64decode(data)), entry_id))
+                    except ValueError:
+                        logging.warning(f"Leaving undecodable image entry {entry_id} as text")
+                cursor.executemany('UPDATE clipboard_blobs SET data = ? WHERE entry_id = ?', decoded)
+                cursor.execute('PRAGMA user_version = 4')
+                logging.info(f"Converted {len(decoded)} base64 images to BLOBs")
+            
+            if schema_version < 5:
+                # Keep sub-second order between captures: seconds -> microseconds
+                cursor.execute('UPDATE clipboard_entries SET timestamp = timestamp * 1000000')
+                cursor.execute('PRAGMA user_version = 5')
+                logging.info("Converted timestamps to microseconds")
+            
+            if schema_version < 6:
+                # Passwords move to salted scrypt; existing accounts are rehashed
+                # the next time they log in
+                cursor.execute('ALTER TABLE users ADD COLUMN salt BLOB')
+                cursor.execute('PRAGMA user_version = 6')
+                logging.info("Added password salts")
+            
+            # Let history and session queries walk an index in display order
+            # instead of scanning and sorting every row. Every history query
+            # filters on is_deleted = 0, so deleted entries are left out of it.
+            cursor.execute('DROP INDEX IF EXISTS idx_entries_session_time')
+            cursor.execute('DROP INDEX IF EXISTS idx_entries_session_ts')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_entries_live
+                ON clipboard_entries (session_id, timestamp DESC, id DESC)
+                WHERE is_deleted = 0
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_user
+                ON sessions (user_id, is_deleted, name, is_default)
+            ''')
+            self.db_connection.commit()
+            
             logging.debug("Database initialized successfully")
             
         except sqlite3.Error as e:
+            if self.db_connection.in_transaction:
+                self.db_connection.rollback()
             logging.error(f"Database initialization error: {e}")
             QMessageBox.critical(self, "Database Error", 
                                "Failed to initialize database. The application may not work correctly.")
 
     def showContextMenu(self, position):
         """Show context menu for history items"""
-        item = self.history_display.itemAt(position)
-        if not item:
+        index = self.history_display.indexAt(position)
+        if not index.isValid():
             return
         
         # Get the clipboard content type
-        row = self.history_display.row(item)
-        if row < 0 or row >= len(self.clipboard_history):
+        entry = self.history_model.entryAt(index.row())
+        if entry is None:
             return
             
-        content, content_type, _, _, _ = self.clipboard_history[row]
+        content_type = entry[1]
         
         menu = QMenu(self)
         preview_action = menu.addAction("Preview")
@@ -1341,15 +1971,12 @@ class ClipboardManagerV2(QMainWindow):
 
     def modifyClipboardEntry(self):
         """Modify the selected clipboard entry."""
-        current_item = self.history_display.currentItem()
-        if not current_item:
-            return
-            
-        row = self.history_display.row(current_item)
-        if row < 0 or row >= len(self.clipboard_history):
+        entry = self.history_model.entryAt(self.history_display.currentIndex().row())
+        if entry is None:
             return
             
-        content, content_type, _, _, timestamp = self.clipboard_history[row]
+        entry_id, content_type, _, _, timestamp, _ = entry
+        content = self.history_model.entryContent(entry_id)
         
         if content_type != 'text':
             QMessageBox.information(self, "Modify Entry", "Only text entries can be modified.")
@@ -1364,30 +1991,47 @@ class ClipboardManagerV2(QMainWindow):
         )
         
         if ok and new_content != content:
-            cursor = self.db_connection.cursor()
+            self._forgetRecentEntries(lambda _, recent_id: recent_id == entry_id)
             now = datetime.now(timezone.utc)
             
             # Update the entry in database
-            cursor.execute('''
-                UPDATE clipboard_entries 
-                SET content = ?, timestamp = ? 
-                WHERE content = ? 
-                AND session_id = ? 
-                AND timestamp = ?
-            ''', (new_content, now, content, self.current_session_id, timestamp))
-            
-            self.db_connection.commit()
-            self.loadClipboardHistory()
+            self.db_writer.enqueueMany([
+                ('''
+                    UPDATE clipboard_entries 
+                    SET preview = ?, timestamp = ? 
+                    WHERE id = ?
+                ''', (new_content[:TEXT_PREVIEW_LENGTH], now, entry_id)),
+                ('UPDATE clipboard_blobs SET data = ? WHERE entry_id = ?', (new_content, entry_id)),
+            ], callback=functools.partial(self._onEntryModified, self.current_session_id, entry_id))
             self.statusBar().showMessage("Entry modified successfully", 2000)
 
     def cleanup(self):
         """Cleanup resources before quitting."""
-        # Stop the clipboard monitoring thread
-        if hasattr(self, 'clipboard_thread'):
-            self.clipboard_thread.stop()
-            self.clipboard_thread.wait()  # Wait for the thread to finish
-        
-        # Close database connection
+        # Stop listening for clipboard changes
+        try:
+            QApplication.clipboard().dataChanged.disconnect(self._clip_debounce.start)
+            self._clip_debounce.stop()
+        except (TypeError, AttributeError):
+            pass  # Monitor was never started
+        if hasattr(self, '_cb_timer'):
+            self._cb_timer.stop()
+        
+        # Let in-flight image encodes land in the writer queue first
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        
+        # Finish queued writes; the window is going away, so skip their refreshes
+        if hasattr(self, 'db_writer'):
+            self.db_writer.committed.disconnect(self._onWritesCommitted)
+            self.db_writer.stop()
+        
+        # Persist the last selected session
+        if hasattr(self, 'settings'):
+            self.settings.sync()
+        
+        # Close database connections
+        if hasattr(self, 'read_pool'):
+            self.read_pool.close()
         if hasattr(self, 'db_connection'):
             self.db_connection.close()
 
@@ -1396,32 +2040,111 @@ class ClipboardManagerV2(QMainWindow):
         self.cleanup()
         event.accept()
 
+def configure_connection(connection):
+    """Apply the pragmas every connection to the history database uses."""
+    cursor = connection.cursor()
+    # WAL lets reads proceed alongside writes and needs only one fsync per commit
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-20000')
+    # Large image captures can balloon the WAL; truncate it after checkpoints
+    cursor.execute('PRAGMA journal_size_limit=67108864')
+    # Blobs, entries and sessions must reference rows that exist
+    cursor.execute('PRAGMA foreign_keys=ON')
+
 def adapt_datetime(dt):
-    """Convert datetime to UTC ISO format string."""
+    """Convert datetime to Unix time in microseconds."""
     if dt is None:
         return None
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f%z")
+    return int(dt.timestamp()) * 1_000_000 + dt.microsecond
 
-def convert_datetime(val):
-    """Convert string to datetime object."""
-    if val is None:
-        return None
-    try:
-        if isinstance(val, bytes):
-            val = val.decode('utf-8')
-        if isinstance(val, str):
-            return datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f%z")
-        return val
-    except (ValueError, TypeError):
-        return None
+@functools.lru_cache(maxsize=1024)
+def format_timestamp(timestamp):
+    """Format a stored timestamp (Unix microseconds) in local time."""
+    utc_dt = datetime.fromtimestamp(timestamp // 1_000_000, timezone.utc)
+    local_dt = utc_dt.astimezone()
+    return local_dt.strftime("%Y-%m-%d %I:%M:%S %p %Z")
 
-# Register the adapters and converters
+# Datetime parameters are written as Unix microseconds; rows come back as
+# plain integers, so no converter is registered
 sqlite3.register_adapter(datetime, adapt_datetime)
-sqlite3.register_converter("timestamp", convert_datetime)
 
-def hash_password(password):
-    """Hash password using SHA-256."""
-    return hashlib.sha256(password.encode()).hexdigest()
+def image_digest(image):
+    """Return a hash of a QImage's pixel data, read in place without copying."""
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return hashlib.blake2b(bits, digest_size=16).digest()
+
+def _image_bytes(content):
+    """Return stored image content (PNG bytes, or base64 text from older rows) as bytes."""
+    if isinstance(content, str):
+        return base64.b64decode(content)
+    if isinstance(content, (bytearray, memoryview)):
+        return bytes(content)
+    return content
+
+def image_size(content):
+    """Return the pixel size of stored image content, reading only the image header."""
+    buffer = QBuffer()
+    buffer.setData(_image_bytes(content))
+    buffer.open(QBuffer.ReadOnly)
+    return QImageReader(buffer, IMAGE_FORMAT.encode()).size()
+
+def load_image(content, max_size=None):
+    """Decode stored image content (PNG bytes, or base64 text from older rows) into a QImage.
+    
+    If max_size is given, images larger than max_size x max_size are scaled down
+    by the reader while decoding.
+    """
+    content = _image_bytes(content)
+    
+    if max_size is None:
+        return QImage.fromData(content, IMAGE_FORMAT)
+    
+    image_data = QByteArray(content)
+    buffer = QBuffer(image_data)
+    buffer.open(QBuffer.ReadOnly)
+    reader = QImageReader(buffer, IMAGE_FORMAT.encode())
+    size = reader.size()
+    if size.isValid() and (size.width() > max_size or size.height() > max_size):
+        reader.setScaledSize(size.scaled(max_size, max_size, Qt.KeepAspectRatio))
+    return reader.read()
+
+def load_pixmap(content):
+    """Decode stored image content directly into a QPixmap, or return None if it is invalid."""
+    pixmap = QPixmap()
+    if not pixmap.loadFromData(_image_bytes(content), IMAGE_FORMAT):
+        return None
+    return pixmap
+
+def make_thumbnail(image):
+    """Return a THUMBNAIL_SIZE PNG of a QImage for the history list."""
+    thumbnail = image.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    byte_array = QByteArray()
+    buffer = QBuffer(byte_array)
+    buffer.open(QBuffer.WriteOnly)
+    thumbnail.save(buffer, IMAGE_FORMAT)
+    return sqlite3.Binary(buffer.data())
+
+def hash_password(password, salt):
+    """Derive a password hash with scrypt, returning the raw 32-byte key."""
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=2**14, r=8, p=1, dklen=32)
+
+def _legacy_password_digest(password):
+    """Unsalted SHA-256 of accounts created before scrypt; only used to verify them."""
+    return _sha256(password.encode('utf-8')).digest()
+
+@functools.lru_cache(maxsize=8)
+def _pw_digest(password, salt):
+    """hash_password() memoized per login attempt, so retrying the same credentials skips re-hashing."""
+    return hash_password(password, salt)
+
+# All stylesheets are parsed once at application level; each window scopes
+# its rules by objectName
+APP_QSS = (GLOBAL_QSS + HoverPreviewWindow._QSS + PreviewDialog._QSS +
+           LoginDialog._QSS + RegisterDialog._QSS)
 
 if __name__ == '__main__':
     import platform
@@ -1446,6 +2169,7 @@ if __name__ == '__main__':
     app.setApplicationName(display_name)
     app.setOrganizationName("ClipboardManagerV2")
     app.setApplicationDisplayName(display_name)
+    app.setStyleSheet(APP_QSS)
     
     # Set the app icon
     icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons', 'clipboard_icon.png')
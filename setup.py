@@ -28,7 +28,8 @@ OPTIONS = {
         'LSBackgroundOnly': False,
         'NSAppleScriptEnabled': False,
     },
-    'packages': ['PyQt5'],
+    # Only the Qt modules the app imports; bundling the whole PyQt5 package
+    # would pull in every Qt framework and slow down launch
     'includes': [
         'PyQt5',
         'PyQt5.QtCore',
@@ -36,7 +37,13 @@ OPTIONS = {
         'PyQt5.QtWidgets',
         'sqlite3',
     ],
-    'excludes': ['tkinter', 'matplotlib', 'numpy'],
+    'excludes': [
+        'tkinter', 'matplotlib', 'numpy',
+        'PyQt5.QtWebEngine', 'PyQt5.QtWebEngineCore', 'PyQt5.QtWebEngineWidgets',
+        'PyQt5.QtQml', 'PyQt5.QtQuick', 'PyQt5.QtMultimedia', 'PyQt5.QtDesigner',
+        'PyQt5.QtHelp', 'PyQt5.QtSql', 'PyQt5.QtTest', 'PyQt5.QtBluetooth',
+        'PyQt5.QtNetwork', 'PyQt5.QtPositioning', 'PyQt5.QtSerialPort', 'PyQt5.Qsci',
+    ],
 }
 
 setup(